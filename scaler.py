@@ -1,42 +1,303 @@
 import sys
 import os
+import io
+import math
+from concurrent.futures import ThreadPoolExecutor
 from PyQt6.QtWidgets import (
     QApplication, QWidget, QLabel, QPushButton,
     QVBoxLayout, QHBoxLayout, QFileDialog, QMessageBox,
     QSizePolicy, QGridLayout, QFrame, QComboBox, QProgressBar
 )
-from PyQt6.QtGui import QPixmap, QImage, QIcon
-from PyQt6.QtCore import Qt, QThread, pyqtSignal
-from PIL import Image
-
-# Worker thread for resizing image in the background
-class ResizeWorker(QThread):
-    # Signal to update progress bar
-    progress_changed = pyqtSignal(int)
-    # Signal emitted when resizing is finished, passes the resized PIL image
-    finished = pyqtSignal(object)
-
-    def __init__(self, pil_image, scale, interp_method):
+from PyQt6.QtGui import QPixmap, QPixmapCache, QImage, QIcon
+from PyQt6.QtCore import (
+    Qt, QObject, QRunnable, QSize, QThreadPool, QTimer, pyqtSignal
+)
+from PIL import Image, ImageChops
+
+# Optional libvips backend for decoding large images, see open_image_vips
+try:
+    import pyvips
+except (ImportError, OSError):
+    pyvips = None
+
+# Decoder used for previews: 'pillow' (default) or 'vips' (needs pyvips)
+BACKEND = os.environ.get('IMAGESCALER_BACKEND', 'pillow').lower()
+
+# Reduced-size JPEG decoding for previews; IMAGESCALER_JPEG_DRAFT=0 turns it
+# off so previews are always resampled from the full-resolution decode
+JPEG_DRAFT = os.environ.get('IMAGESCALER_JPEG_DRAFT', '1') != '0'
+
+# QImage format and bytes per pixel for each PIL mode kept in memory
+QIMAGE_FORMATS = {
+    'L': (QImage.Format.Format_Grayscale8, 1),
+    'RGB': (QImage.Format.Format_RGB888, 3),
+    'RGBA': (QImage.Format.Format_RGBA8888, 4),
+    # Premultiplied alpha, which Qt composites without converting first
+    'RGBa': (QImage.Format.Format_RGBA8888_Premultiplied, 4),
+}
+
+# Pillow resampling filters in the order of the interpolation selector
+PIL_METHODS = (Image.NEAREST, Image.BILINEAR, Image.BICUBIC, Image.LANCZOS)
+
+# Large shrinks first box-reduce the source by an integer factor, keeping at
+# least this many times the target size for the filter (see resize_image)
+REDUCING_GAP = 3.0
+
+# Outputs of at least this many pixels are resized in horizontal strips on all
+# CPU cores (Pillow releases the GIL while resampling); see resize_in_strips
+STRIP_RESIZE_MIN_PIXELS = 2000 * 2000
+
+# Upper bound on the number of strips (and threads) of one resize
+STRIP_RESIZE_MAX_STRIPS = 8
+
+# Encoder options per output format: high-quality progressive JPEGs with
+# optimized Huffman tables; other formats use Pillow's defaults
+SAVE_OPTIONS = {
+    'JPEG': {'quality': 92, 'optimize': True, 'progressive': True},
+}
+
+# Memory budget of QPixmapCache, which holds finished previews (in KB)
+PIXMAP_CACHE_LIMIT_KB = 128 * 1024
+
+# File extensions accepted by drag & drop
+IMAGE_EXTS = frozenset({'.png', '.jpg', '.jpeg', '.bmp', '.gif'})
+
+# Window icon, loaded from icon.png on first use by get_app_icon
+APP_ICON = None
+
+def get_app_icon():
+    # Load the window icon once and share it between windows; an empty QIcon
+    # is returned (and cached) if icon.png is missing
+    global APP_ICON
+    if APP_ICON is None:
+        icon_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'icon.png')
+        APP_ICON = QIcon(icon_path) if os.path.exists(icon_path) else QIcon()
+    return APP_ICON
+
+def open_image(file_path, max_dim=None):
+    # Open and decode an image in one of the QIMAGE_FORMATS modes and return it
+    # with the true size of the file and whether it is Pillow's full-resolution
+    # decode, which saving can use as is. With max_dim, JPEGs are decoded at the
+    # smallest DCT scale (1/2, 1/4, 1/8) that still keeps the longest side at
+    # least max_dim pixels; other formats ignore it
+    if max_dim and BACKEND == 'vips' and pyvips is not None:
+        try:
+            return open_image_vips(file_path, max_dim)
+        except pyvips.Error:
+            # Formats libvips cannot load (e.g. BMP) are decoded by Pillow
+            pass
+    # The file contents are only needed until the pixels are decoded
+    with io.BytesIO(read_file(file_path)) as buf:
+        img = Image.open(buf)
+        original_size = img.size
+        if max_dim and JPEG_DRAFT and max(img.size) > max_dim:
+            ratio = max_dim / max(img.size)
+            img.draft(None, (math.ceil(img.width * ratio), math.ceil(img.height * ratio)))
+        img.load()
+    return normalize_mode(img), original_size, img.size == original_size
+
+def read_file(file_path):
+    # Read the whole file in one sequential read, so the decoder works from
+    # memory instead of issuing many small reads against a cold disk cache
+    with open(file_path, 'rb') as f:
+        if hasattr(os, 'posix_fadvise'):
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        return f.read()
+
+def open_image_vips(file_path, max_dim):
+    # Decode through libvips, which shrinks on load where the format allows it
+    # and streams the rest on all cores, so the full-size image is never held
+    # in memory. Returns the same triple as open_image; the result never counts
+    # as a full decode, since libvips may render pixels differently from Pillow
+    header = pyvips.Image.new_from_file(file_path, access='sequential')
+    original_size = (header.width, header.height)
+    # no_rotate keeps the preview oriented like the Pillow-decoded saved image
+    if header.bands == 1 and header.format == 'ushort':
+        # 16-bit grayscale goes through normalize_mode like Pillow's I;16
+        # decode, which clips to 8 bits; thumbnail would rescale to 8 bits
+        # instead, so the image is resampled at 16 bits with resize
+        scale = max_dim / max(original_size)
+        vips_img = header.resize(scale) if scale < 1 else header
+        raw_mode = 'I;16' if sys.byteorder == 'little' else 'I;16B'
+        img = Image.frombytes(raw_mode, (vips_img.width, vips_img.height), vips_img.write_to_memory())
+        return normalize_mode(img), original_size, False
+    if JPEG_DRAFT:
+        vips_img = pyvips.Image.thumbnail(file_path, max_dim, height=max_dim, size='down', no_rotate=True)
+    else:
+        # thumbnail_image resamples the full-resolution decode, without shrink-on-load
+        vips_img = header.thumbnail_image(max_dim, height=max_dim, size='down', no_rotate=True)
+    vips_img = vips_img.colourspace('b-w' if vips_img.bands <= 2 else 'srgb')
+    if vips_img.format != 'uchar':
+        vips_img = vips_img.cast('uchar')
+    mode = {1: 'L', 2: 'LA', 3: 'RGB', 4: 'RGBA'}[vips_img.bands]
+    img = Image.frombytes(mode, (vips_img.width, vips_img.height), vips_img.write_to_memory())
+    return normalize_mode(img), original_size, False
+
+def normalize_mode(img):
+    # Keep L/RGB/RGBA images in their native mode; grayscale and opaque images
+    # stay at 1 or 3 bytes per pixel instead of being expanded to RGBA
+    if img.mode in QIMAGE_FORMATS and 'transparency' not in img.info:
+        return img
+    # Images with an alpha band or a transparent colour (PNG tRNS) become RGBA,
+    # other grayscale modes L and other colour modes (P, CMYK, YCbCr, ...) RGB
+    if (img.mode == 'I' or img.mode.startswith('I;')) and 'transparency' in img.info:
+        return transparent_gray_to_rgba(img)
+    if 'A' in img.getbands() or 'transparency' in img.info:
+        return img.convert('RGBA')
+    if img.mode in ('1', 'I', 'F') or img.mode.startswith('I;'):
+        return img.convert('L')
+    return img.convert('RGB')
+
+def transparent_gray_to_rgba(img):
+    # Pillow drops the transparent value when converting 16/32-bit grayscale to
+    # RGBA, so build the alpha mask here: the two clipped differences from the
+    # transparent value are both 0 only where the pixel equals it
+    trns = img.info['transparency']
+    gray = img.convert('I')
+    above = gray.point(lambda v: (v - trns) * 255).convert('L')
+    below = gray.point(lambda v: (trns - v) * 255).convert('L')
+    rgba = img.convert('L').convert('RGBA')
+    rgba.putalpha(ImageChops.lighter(above, below))
+    return rgba
+
+def resize_image(img, size, method):
+    # Resize with Pillow; for large shrink factors a cheap box reduce runs before
+    # the filter, which would otherwise convolve over every source pixel
+    if img.size == size:
+        # Same size (e.g. scale 1.0): every filter would return a copy
+        return img
+    if size[0] * 2 < img.width and size[1] * 2 < img.height:
+        return img.resize(size, method, reducing_gap=REDUCING_GAP)
+    # Nearest picks one source row per output row, and a strip box rounds that
+    # choice differently from a whole-image resize; it is cheap anyway
+    if (method != Image.NEAREST and size[0] * size[1] >= STRIP_RESIZE_MIN_PIXELS
+            and (os.cpu_count() or 1) > 1):
+        return resize_in_strips(img, size, method, min(os.cpu_count(), STRIP_RESIZE_MAX_STRIPS))
+    return img.resize(size, method)
+
+def fit_image(img, limit):
+    # Shrink an image so its longest side is at most limit pixels, resampling
+    # straight from it instead of from a full-size copy; an image that already
+    # fits is returned itself
+    if max(img.size) <= limit:
+        return img
+    ratio = limit / max(img.size)
+    size = (max(1, round(img.width * ratio)), max(1, round(img.height * ratio)))
+    return img.resize(size, Image.LANCZOS, reducing_gap=REDUCING_GAP)
+
+def resize_in_strips(img, size, method, strips):
+    # Resize each horizontal strip of the output in its own thread. The box
+    # argument selects the matching source rows, while the filter still reads
+    # its support from beyond them, so the strips join without seams. With the
+    # convolution filters, premultiplied values may differ by 1 from a single
+    # resize due to rounding of the box edges; Nearest is not split, see
+    # resize_image
+    width, height = size
+    # Pillow premultiplies RGBA around every resize call, which would convert
+    # the whole source once per strip; do it once for all strips instead
+    mode = img.mode
+    if mode == 'RGBA':
+        img = img.convert('RGBa')
+    strips = min(strips, height)
+    bounds = [height * i // strips for i in range(strips + 1)]
+    y_ratio = img.height / height
+
+    def resize_strip(i):
+        top, bottom = bounds[i], bounds[i + 1]
+        box = (0, top * y_ratio, img.width, bottom * y_ratio)
+        return top, img.resize((width, bottom - top), method, box=box)
+
+    out = Image.new(img.mode, size)
+    with ThreadPoolExecutor(max_workers=strips) as executor:
+        for top, strip in executor.map(resize_strip, range(strips)):
+            out.paste(strip, (0, top))
+    if mode == 'RGBA':
+        out = out.convert('RGBA')
+    return out
+
+# Signals of ResizeWorker (QRunnable is not a QObject and cannot own signals).
+# The result carries the generation of the job so stale results can be dropped
+class ResizeSignals(QObject):
+    # Signal emitted when a job ends: (generation, preview QImage, pixel bytes
+    # borrowed by the QImage); both are None if the job was cancelled
+    finished = pyqtSignal(int, object, object)
+
+# Job for resizing image in the background on the thread pool
+class ResizeWorker(QRunnable):
+    def __init__(self, generation, pil_image, interp_method, target_size):
         super().__init__()
-        self.pil_image = pil_image        # Original PIL image
-        self.scale = scale                # Scale factor
+        self.signals = ResizeSignals()
+        self.generation = generation      # Job number, see ImageScaler.resize_generation
+        self.pil_image = pil_image        # Source PIL image
         self.interp_method = interp_method # Interpolation method
+        self.target_size = target_size    # Output (width, height)
+        self.cancelled = False            # Set from the GUI thread when superseded
+
+    def cancel(self):
+        # Cooperative cancellation: the job stops at its next check
+        self.cancelled = True
 
     def run(self):
-        # Calculate new dimensions
-        width = max(1, int(self.pil_image.width * self.scale))
-        height = max(1, int(self.pil_image.height * self.scale))
-        # Simulate progress in 10 steps for user feedback
-        steps = 10
-        base_sleep = 5
-        sleep_time = max(5, int(base_sleep * self.scale))
-        for i in range(steps):
-            self.msleep(sleep_time)
-            self.progress_changed.emit(int((i + 1) / steps * 100))
-        # Perform the actual resizing operation
-        resized = self.pil_image.resize((width, height), self.interp_method)
-        # Emit the finished signal with the resized image
-        self.finished.emit(resized)
+        width, height = self.target_size
+        # finished is emitted on every path, including errors (e.g. MemoryError
+        # on huge outputs), so the window knows the pool is free again
+        try:
+            # The job may have been superseded while it was queued
+            if self.cancelled:
+                self.signals.finished.emit(self.generation, None, None)
+                return
+            # Perform the actual resizing operation
+            resized = resize_image(self.pil_image, (width, height), self.interp_method)
+            if self.cancelled:
+                self.signals.finished.emit(self.generation, None, None)
+                return
+            # The working copy is premultiplied already; a preview resampled from
+            # an RGBA original is premultiplied here, off the GUI thread, instead
+            # of on every paint
+            if resized.mode == 'RGBA':
+                resized = resized.convert('RGBa')
+            # Wrap the PIL pixels in a QImage here as well, so the GUI thread only
+            # has to turn it into a pixmap. QImage borrows the raw bytes without
+            # copying, so they are passed along to be kept alive with it
+            qimg_format, bytes_per_pixel = QIMAGE_FORMATS[resized.mode]
+            data = resized.tobytes("raw", resized.mode)
+            qimg = QImage(data, width, height, width * bytes_per_pixel, qimg_format)
+        except Exception:
+            self.signals.finished.emit(self.generation, None, None)
+            return
+        self.signals.finished.emit(self.generation, qimg, data)
+
+# Signals of SaveWorker
+class SaveSignals(QObject):
+    # Signal emitted when saving ends: (output path, error message or '')
+    finished = pyqtSignal(str, str)
+
+# Job for rendering the full-resolution result and writing it to disk
+class SaveWorker(QRunnable):
+    def __init__(self, pil_image, source_path, full_decode, target_size, interp_method, file_path, fmt):
+        super().__init__()
+        self.signals = SaveSignals()
+        self.pil_image = pil_image          # Loaded image, possibly a reduced decode
+        self.source_path = source_path      # File to re-read at full resolution
+        self.full_decode = full_decode      # Whether pil_image is Pillow's full-resolution decode
+        self.target_size = target_size      # Output (width, height)
+        self.interp_method = interp_method  # Interpolation method
+        self.file_path = file_path          # Output file
+        self.fmt = fmt                      # Output format for Pillow
+
+    def run(self):
+        try:
+            # Render from Pillow's full-resolution decode: the loaded image may be
+            # a reduced JPEG decode or come from libvips
+            img_full = self.pil_image
+            if not self.full_decode:
+                img_full, _, _ = open_image(self.source_path)
+            img_out = resize_image(img_full, self.target_size, self.interp_method)
+            img_out.save(self.file_path, self.fmt, **SAVE_OPTIONS.get(self.fmt, {}))
+        except Exception as e:
+            self.signals.finished.emit(self.file_path, str(e))
+            return
+        self.signals.finished.emit(self.file_path, '')
 
 # Main application window
 class ImageScaler(QWidget):
@@ -45,9 +306,9 @@ class ImageScaler(QWidget):
         self.setWindowTitle("Image Resolution Scaler")
 
         # Set window icon if present
-        icon_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'icon.png')
-        if os.path.exists(icon_path):
-            self.setWindowIcon(QIcon(icon_path))
+        icon = get_app_icon()
+        if not icon.isNull():
+            self.setWindowIcon(icon)
 
         # Supported languages and UI texts
         self.languages = ['en', 'ru']
@@ -115,11 +376,27 @@ class ImageScaler(QWidget):
 
         # State variables for image and UI
         self.scale = 1.0                    # Current scale factor
-        self.img_pil_original = None        # Original PIL image
-        self.img_resized = None             # Resized PIL image
-        self.worker = None                  # Worker thread for resizing
-        self.cached_pixmap = None           # Cached QPixmap for display
+        self.img_pil_original = None        # Original PIL image (may be a reduced or libvips decode)
+        self.original_size = None           # True (width, height) of the image file
+        self.original_full_decode = False   # Whether img_pil_original can be saved from as is
+        self.file_path = None               # Path of the loaded file, re-read for saving
+        self.img_pil_work = None            # Screen-sized working copy used for previews (RGBa if shrunk from RGBA)
+        self.worker = None                  # Resize job currently in flight
+        self.resize_generation = 0          # Incremented for every new resize job
+        self.restart_pending = False        # Start a new job once the running one ends
+        self.save_worker = None             # Save job in flight
+        self.thread_pool = QThreadPool.globalInstance()
+        self.pending_cache_key = None       # QPixmapCache key of the preview being rendered
+        self.shown_preview_key = None       # QPixmapCache key of the preview on screen
+        # Finished previews are kept in Qt's global pixmap cache, which evicts
+        # least recently used entries once the budget is exceeded
+        QPixmapCache.setCacheLimit(PIXMAP_CACHE_LIMIT_KB)
+        self.cached_pixmap = None           # Pixmap of the preview, as stored in QPixmapCache
+        self.cached_image = None            # QImage of the preview: the worker's result, or read back for a rescale
+        self.cached_image_data = None       # Pixel bytes borrowed by cached_image
         self.last_pixmap_scaled = None      # Last scaled QPixmap for display
+        self.last_scaled_key = None         # (pixmap key, label size, mode) of last_pixmap_scaled
+        self.resizing = False               # True while the window is being resized
 
         # Interpolation method selector (combo box)
         self.combo_interp = QComboBox()
@@ -156,6 +433,8 @@ class ImageScaler(QWidget):
             self.info_grid.addWidget(lbl_title, i, 0)
             self.info_grid.addWidget(lbl_value, i, 1)
             self.labels_values.append(lbl_value)
+        # Texts currently shown in labels_values, so unchanged values skip setText
+        self.last_info = ["-"] * 4
         # Titles for each parameter row
         self.info_titles = [self.info_grid.itemAtPosition(i, 0).widget() for i in range(4)]
         self.info_container = QFrame()
@@ -169,10 +448,9 @@ class ImageScaler(QWidget):
         )
         self.label_interpolation.hide()
 
-        # Progress bar for resizing operation
+        # Busy indicator for resizing operation (Pillow reports no progress)
         self.progress_bar = QProgressBar()
-        self.progress_bar.setMaximum(100)
-        self.progress_bar.setValue(0)
+        self.progress_bar.setRange(0, 0)
         self.progress_bar.setTextVisible(False)
         self.progress_bar.hide()
 
@@ -220,6 +498,19 @@ class ImageScaler(QWidget):
 
         self.setLayout(main_layout)
 
+        # Single-shot timer that fires once a burst of resize events has settled
+        self.resize_timer = QTimer(self)
+        self.resize_timer.setSingleShot(True)
+        self.resize_timer.setInterval(40)
+        self.resize_timer.timeout.connect(self.on_resize_settled)
+
+        # Single-shot timer that coalesces repeated scale steps (e.g. holding
+        # a button with auto-repeat) and filter changes into one resize job
+        self.scale_timer = QTimer(self)
+        self.scale_timer.setSingleShot(True)
+        self.scale_timer.setInterval(40)
+        self.scale_timer.timeout.connect(self.start_interpolation)
+
         # Enable drag & drop for the window
         self.setAcceptDrops(True)
 
@@ -232,7 +523,7 @@ class ImageScaler(QWidget):
         # Accept only file drops with image extensions
         if event.mimeData().hasUrls():
             for url in event.mimeData().urls():
-                if url.toLocalFile().lower().endswith(('.png', '.jpg', '.jpeg', '.bmp', '.gif')):
+                if os.path.splitext(url.toLocalFile())[1].lower() in IMAGE_EXTS:
                     event.acceptProposedAction()
                     return
         event.ignore()
@@ -241,7 +532,7 @@ class ImageScaler(QWidget):
         # Load the dropped image file
         for url in event.mimeData().urls():
             file_path = url.toLocalFile()
-            if file_path.lower().endswith(('.png', '.jpg', '.jpeg', '.bmp', '.gif')):
+            if os.path.splitext(file_path)[1].lower() in IMAGE_EXTS:
                 self.load_image_from_path(file_path)
                 break
 
@@ -249,7 +540,24 @@ class ImageScaler(QWidget):
         # Load image from file and reset scale
         t = self.texts[self.lang]
         try:
-            self.img_pil_original = Image.open(file_path).convert("RGBA")
+            # Free previews of the previous image before decoding the new one
+            QPixmapCache.clear()
+            self.shown_preview_key = None
+            # Nothing larger than the screen is ever shown 1:1, so large JPEGs are
+            # decoded at reduced size and previews are resampled from a working
+            # copy bounded by the screen size. Saving re-reads the full image
+            screen = self.screen().availableGeometry()
+            limit = max(screen.width(), screen.height())
+            self.img_pil_original, self.original_size, self.original_full_decode = open_image(file_path, limit)
+            self.file_path = file_path
+            # Transparent previews are resampled and shown premultiplied, so a
+            # shrunk working copy is premultiplied once here rather than per
+            # preview. An image that already fits is used as is, without a
+            # second full copy; ResizeWorker premultiplies its previews
+            work = self.img_pil_original
+            if work.mode == 'RGBA' and max(work.size) > limit:
+                work = work.convert('RGBa')
+            self.img_pil_work = fit_image(work, limit)
             self.scale = 1.0
             self.update_buttons_state()
             self.start_interpolation()
@@ -268,45 +576,73 @@ class ImageScaler(QWidget):
         titles = [t['scale'], t['orig_size'], t['curr_size'], t['frame_size']]
         for lbl, title in zip(self.info_titles, titles):
             lbl.setText(title)
-        self.combo_interp.blockSignals(True)
-        self.combo_interp.clear()
-        self.combo_interp.addItems(t['interp_methods'])
-        self.combo_interp.setCurrentIndex(2)
-        self.combo_interp.blockSignals(False)
+        # Rename the entries in place so the selected method is kept
+        for i, name in enumerate(t['interp_methods']):
+            self.combo_interp.setItemText(i, name)
         self.combo_lang.setItemText(0, "English")
         self.combo_lang.setItemText(1, "Русский")
         # If no image loaded, show placeholder text
-        if self.img_resized is None:
+        if self.cached_pixmap is None:
             self.label_image.clear()
             self.label_image.setText(t['no_image'])
-            self.cached_pixmap = None
             self.last_pixmap_scaled = None
+            self.last_scaled_key = None
             self.update_frame_size_label()
-        else:
-            self.show_cached_pixmap()
 
-    def show_cached_pixmap(self):
-        # Display the cached pixmap, scaled to fit the label
+    def show_cached_image(self):
+        # Display the cached preview, scaled to fit the label
         if self.cached_pixmap:
             label_w = self.label_image.width()
             label_h = self.label_image.height()
-            pixmap_scaled = self.cached_pixmap.scaled(
-                label_w, label_h,
-                Qt.AspectRatioMode.KeepAspectRatio,
-                Qt.TransformationMode.SmoothTransformation
+            # Cheap scaling while the window is being resized, smooth once it settles
+            if self.resizing:
+                mode = Qt.TransformationMode.FastTransformation
+            else:
+                mode = Qt.TransformationMode.SmoothTransformation
+            # Skip rescaling if neither the image nor the label size changed
+            key = (self.cached_pixmap.cacheKey(), label_w, label_h, mode)
+            if key == self.last_scaled_key:
+                return
+            # Previews are normally resampled to the fitted size already, in
+            # which case the pixmap is shown as is; a 1 px difference from
+            # aspect-ratio rounding is not worth a smooth rescale either
+            fit_size = self.cached_pixmap.size().scaled(
+                label_w, label_h, Qt.AspectRatioMode.KeepAspectRatio
             )
+            if (abs(fit_size.width() - self.cached_pixmap.width()) <= 1
+                    and abs(fit_size.height() - self.cached_pixmap.height()) <= 1):
+                pixmap_scaled = self.cached_pixmap
+            else:
+                # Scale the CPU-side image first so only the label-sized result
+                # is copied into a pixmap; a preview taken from QPixmapCache is
+                # read back once, on the first rescale
+                if self.cached_image is None:
+                    self.cached_image = self.cached_pixmap.toImage()
+                image_scaled = self.cached_image.scaled(
+                    label_w, label_h,
+                    Qt.AspectRatioMode.KeepAspectRatio,
+                    mode
+                )
+                pixmap_scaled = QPixmap.fromImage(image_scaled)
             self.label_image.setPixmap(pixmap_scaled)
             self.last_pixmap_scaled = pixmap_scaled
+            self.last_scaled_key = key
             self.update_frame_size_label()
 
     def update_frame_size_label(self):
         # Update the label showing the image size in the frame
-        if self.img_resized and self.last_pixmap_scaled:
-            self.labels_values[3].setText(
-                f"{self.last_pixmap_scaled.width()}×{self.last_pixmap_scaled.height()} px"
+        if self.cached_pixmap and self.last_pixmap_scaled:
+            self.set_info_value(
+                3, f"{self.last_pixmap_scaled.width()}×{self.last_pixmap_scaled.height()} px"
             )
         else:
-            self.labels_values[3].setText("-")
+            self.set_info_value(3, "-")
+
+    def set_info_value(self, i, val):
+        # setText relayouts and repaints the panel, so only call it on a change
+        if val != self.last_info[i]:
+            self.labels_values[i].setText(val)
+            self.last_info[i] = val
 
     def switch_language(self, idx):
         # Change the UI language and update all texts
@@ -315,21 +651,23 @@ class ImageScaler(QWidget):
         self.update_buttons_state()
         # Update interpolation label if visible
         if self.label_interpolation.isVisible():
-            interp_name = self.texts[self.lang]['interp_methods'][self.combo_interp.currentIndex()]
-            self.label_interpolation.setText(self.texts[self.lang]['interp_shown'].format(interp_name))
+            t = self.texts[self.lang]
+            interp_name = t['interp_methods'][self.combo_interp.currentIndex()]
+            self.label_interpolation.setText(t['interp_shown'].format(interp_name))
 
     def update_buttons_state(self):
-        # Enable or disable buttons depending on the state (busy, image loaded, etc.)
-        busy = self.worker is not None and self.worker.isRunning()
-        self.btn_downscale.setEnabled(self.img_pil_original is not None and self.scale > 0.05 and not busy)
-        self.btn_upscale.setEnabled(self.img_pil_original is not None and self.scale < 3.0 and not busy)
-        self.btn_save.setEnabled(self.img_resized is not None and not busy)
-        self.btn_load.setEnabled(not busy)
+        # Enable or disable buttons depending on the state (image loaded, scale limits).
+        # Buttons stay enabled while resizing: a new request supersedes the running one
+        # Save stays disabled while a save is running
+        self.btn_downscale.setEnabled(self.img_pil_original is not None and self.scale > 0.05)
+        self.btn_upscale.setEnabled(self.img_pil_original is not None and self.scale < 3.0)
+        self.btn_save.setEnabled(self.cached_pixmap is not None and self.save_worker is None)
 
     def on_interp_changed(self):
-        # Called when interpolation method is changed
+        # Called when interpolation method is changed; debounced like the
+        # scale buttons, since scrolling over the combo steps through every entry
         if self.img_pil_original:
-            self.start_interpolation()
+            self.scale_timer.start()
 
     def load_image(self):
         # Open file dialog to select and load an image
@@ -342,86 +680,182 @@ class ImageScaler(QWidget):
             return
         self.load_image_from_path(file_path)
 
+    def selected_interp_method(self):
+        # Map the selected interpolation entry to a Pillow resampling filter
+        idx = self.combo_interp.currentIndex()
+        return PIL_METHODS[idx] if 0 <= idx < len(PIL_METHODS) else Image.BICUBIC
+
+    def scaled_size(self):
+        # Size of the original image at the current scale
+        return (
+            max(1, int(self.original_size[0] * self.scale)),
+            max(1, int(self.original_size[1] * self.scale))
+        )
+
+    def preview_size(self):
+        # Size the scaled image takes up in the label: anything larger would
+        # only be shrunk again by Qt, so the preview is resampled to fit directly
+        size = QSize(*self.scaled_size())
+        label_size = self.label_image.size()
+        if size.width() > label_size.width() or size.height() > label_size.height():
+            size = size.scaled(label_size, Qt.AspectRatioMode.KeepAspectRatio)
+        return max(1, size.width()), max(1, size.height())
+
     def start_interpolation(self):
-        # Start resizing the image in a background thread
-        self.update_buttons_state() # Block buttons immediately
-        # Stop previous worker if running
-        if self.worker and self.worker.isRunning():
-            self.worker.terminate()
-            self.worker.wait()
+        # Start resizing the image on the thread pool
+        self.scale_timer.stop()
+        # Supersede the job in flight, if any: its result would be stale
+        self.resize_generation += 1
+        if self.worker:
+            self.worker.cancel()
         # Get selected interpolation method
         idx = self.combo_interp.currentIndex()
-        methods = {
-            0: Image.NEAREST,
-            1: Image.BILINEAR,
-            2: Image.BICUBIC,
-            3: Image.LANCZOS,
-        }
-        interp_method = methods.get(idx, Image.BICUBIC)
-        self.progress_bar.setValue(0)
-        self.progress_bar.show()
-        interp_name = self.texts[self.lang]['interp_methods'][idx]
-        self.label_interpolation.setText(self.texts[self.lang]['interp_shown'].format(interp_name))
+        interp_method = self.selected_interp_method()
+        # Resample straight to the size shown in the label, from the working
+        # copy unless the preview is larger than it
+        target_size = self.preview_size()
+        source = self.img_pil_work
+        if target_size[0] > source.width or target_size[1] > source.height:
+            source = self.img_pil_original
+        t = self.texts[self.lang]
+        self.label_interpolation.setText(t['interp_shown'].format(t['interp_methods'][idx]))
         self.label_interpolation.show()
-        # Create and start the worker thread
-        self.worker = ResizeWorker(self.img_pil_original, self.scale, interp_method)
-        self.worker.progress_changed.connect(self.progress_bar.setValue)
-        self.worker.finished.connect(self.on_interpolation_finished)
-        self.worker.finished.connect(self.update_buttons_state)
-        self.worker.start()
-        # Block buttons right after starting the worker
+        # Revisiting a scale level reuses the preview rendered last time
+        key = f"{self.file_path}|{self.scale:.2f}|{idx}|{target_size[0]}x{target_size[1]}"
+        if key == self.shown_preview_key:
+            # Back at the preview already on screen (e.g. + then - again)
+            self.pending_cache_key = None
+            self.restart_pending = False
+            self.progress_bar.setVisible(self.save_worker is not None)
+            return
+        pixmap = QPixmapCache.find(key)
+        if pixmap is not None:
+            self.pending_cache_key = None
+            self.restart_pending = False
+            self.shown_preview_key = key
+            self.show_preview(pixmap)
+            return
+        self.progress_bar.show()
+        # Pillow cannot be interrupted mid-resize, so rather than running jobs
+        # side by side, a burst of requests waits for the running job and then
+        # renders only the latest state
+        if self.worker:
+            self.restart_pending = True
+            return
+        self.pending_cache_key = key
+        # Create and queue the resize job
+        self.worker = ResizeWorker(self.resize_generation, source, interp_method, target_size)
+        self.worker.signals.finished.connect(self.on_worker_finished)
+        self.thread_pool.start(self.worker)
         self.update_buttons_state()
 
-    def on_interpolation_finished(self, pil_img):
-        # Called when resizing is finished
-        self.img_resized = pil_img
-        # Convert PIL image to QPixmap for display
-        data = pil_img.tobytes("raw", "RGBA")
-        qimg = QImage(data, pil_img.width, pil_img.height, QImage.Format.Format_RGBA8888)
-        self.cached_pixmap = QPixmap.fromImage(qimg)
-        self.show_cached_pixmap()
-        self.progress_bar.hide()
+    def on_worker_finished(self, generation, qimg, data):
+        # Result of a resize job; superseded jobs are dropped
+        self.worker = None
+        if self.restart_pending:
+            self.restart_pending = False
+            self.start_interpolation()
+            return
+        if generation != self.resize_generation:
+            return
+        if qimg is None:
+            # The latest job failed; keep the previous preview on screen
+            self.pending_cache_key = None
+            self.progress_bar.setVisible(self.save_worker is not None)
+            return
+        self.on_interpolation_finished(qimg, data)
+
+    def on_interpolation_finished(self, qimg, data):
+        # Called when resizing is finished; the one pixmap made from the result
+        # is both cached and displayed
+        pixmap = QPixmap.fromImage(qimg)
+        if self.pending_cache_key is not None:
+            QPixmapCache.insert(self.pending_cache_key, pixmap)
+            self.shown_preview_key = self.pending_cache_key
+            self.pending_cache_key = None
+        self.show_preview(pixmap, qimg, data)
+
+    def show_preview(self, pixmap, qimg=None, data=None):
+        # Display a finished preview and update the parameter labels
+        self.cached_pixmap = pixmap
+        self.cached_image = qimg
+        self.cached_image_data = data
+        self.show_cached_image()
+        self.progress_bar.setVisible(self.save_worker is not None)
+        self.update_info_labels()
+        self.update_buttons_state()
+
+    def update_info_labels(self):
         # Update parameter labels
+        scaled_w, scaled_h = self.scaled_size()
         values = [
             f"{self.scale:.2f}x",
-            f"{self.img_pil_original.width}×{self.img_pil_original.height} px",
-            f"{pil_img.width}×{pil_img.height} px",
-            f"{self.last_pixmap_scaled.width()}×{self.last_pixmap_scaled.height()} px"
+            f"{self.original_size[0]}×{self.original_size[1]} px",
+            f"{scaled_w}×{scaled_h} px",
         ]
-        for lbl_value, val in zip(self.labels_values, values):
-            lbl_value.setText(val)
-        self.update_buttons_state()
+        for i, val in enumerate(values):
+            self.set_info_value(i, val)
+        self.update_frame_size_label()
 
     def resizeEvent(self, event):
-        # Repaint the image when the window is resized
+        # Repaint quickly while resizing, then smoothly once resizing stops
         super().resizeEvent(event)
+        # Nothing is visible while minimized; showEvent catches up on restore
+        if self.cached_pixmap and not self.isMinimized():
+            self.resizing = True
+            self.show_cached_image()
+            self.resize_timer.start()
+
+    def showEvent(self, event):
+        # Redraw once when the window is shown or restored, since resizes were
+        # skipped while it was minimized
+        super().showEvent(event)
         if self.cached_pixmap:
-            self.show_cached_pixmap()
+            self.resize_timer.start()
+
+    def on_resize_settled(self):
+        # Called by the debounce timer after the last resize event
+        self.resizing = False
+        if self.isMinimized() or not self.label_image.isVisible():
+            return
+        # A preview fitted to a smaller label has too few pixels for the new size
+        if self.cached_pixmap and self.preview_size()[0] > self.cached_pixmap.width():
+            self.start_interpolation()
+        else:
+            self.show_cached_image()
 
     def downscale(self):
         # Decrease the image scale by 0.05, minimum 0.05
         if not self.img_pil_original:
-            QMessageBox.information(self, self.texts[self.lang]['title'], self.texts[self.lang]['please_load'])
+            t = self.texts[self.lang]
+            QMessageBox.information(self, t['title'], t['please_load'])
             return
         if self.scale <= 0.05:
             return
         self.scale = max(0.05, self.scale - 0.05)
-        self.start_interpolation()
+        self.update_buttons_state()
+        # Show the new scale and size right away; the preview follows once
+        # the burst of steps is over
+        self.update_info_labels()
+        self.scale_timer.start()
 
     def upscale(self):
         # Increase the image scale by 0.05, maximum 3.0
         if not self.img_pil_original:
-            QMessageBox.information(self, self.texts[self.lang]['title'], self.texts[self.lang]['please_load'])
+            t = self.texts[self.lang]
+            QMessageBox.information(self, t['title'], t['please_load'])
             return
         if self.scale >= 3.0:
             return
         self.scale = min(3.0, self.scale + 0.05)
-        self.start_interpolation()
+        self.update_buttons_state()
+        self.update_info_labels()
+        self.scale_timer.start()
 
     def save_as(self):
-        # Save the resized image to a file
+        # Save the image at the current scale to a file
         t = self.texts[self.lang]
-        if not self.img_resized:
+        if not self.cached_pixmap:
             QMessageBox.warning(self, t['title'], t['save_none'])
             return
         file_path, _ = QFileDialog.getSaveFileName(
@@ -430,21 +864,37 @@ class ImageScaler(QWidget):
         )
         if not file_path:
             return
-        try:
-            ext = os.path.splitext(file_path)[1].lower()
-            fmt = None
-            if ext in ('.jpg', '.jpeg'):
-                fmt = 'JPEG'
-            elif ext == '.bmp':
-                fmt = 'BMP'
-            elif ext == '.gif':
-                fmt = 'GIF'
-            else:
-                fmt = 'PNG'
-            self.img_resized.save(file_path, fmt)
+        ext = os.path.splitext(file_path)[1].lower()
+        fmt = None
+        if ext in ('.jpg', '.jpeg'):
+            fmt = 'JPEG'
+        elif ext == '.bmp':
+            fmt = 'BMP'
+        elif ext == '.gif':
+            fmt = 'GIF'
+        else:
+            fmt = 'PNG'
+        # Render and encode on the thread pool so the window stays responsive;
+        # the job gets the current scale and method, later changes don't affect it
+        self.save_worker = SaveWorker(
+            self.img_pil_original, self.file_path, self.original_full_decode,
+            self.scaled_size(), self.selected_interp_method(), file_path, fmt
+        )
+        self.save_worker.signals.finished.connect(self.on_save_finished)
+        self.thread_pool.start(self.save_worker)
+        self.progress_bar.show()
+        self.update_buttons_state()
+
+    def on_save_finished(self, file_path, error):
+        # Called when the save job ends
+        t = self.texts[self.lang]
+        self.save_worker = None
+        self.progress_bar.setVisible(self.worker is not None)
+        self.update_buttons_state()
+        if error:
+            QMessageBox.warning(self, t['title'], t['save_error'].format(error))
+        else:
             QMessageBox.information(self, t['title'], t['save_success'].format(file_path))
-        except Exception as e:
-            QMessageBox.warning(self, t['title'], t['save_error'].format(e))
 
 # Application entry point
 if __name__ == "__main__":